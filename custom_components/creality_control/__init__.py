@@ -1,11 +1,15 @@
 """Creality Control integration for Home Assistant."""
 import aiohttp
+from aiohttp import WSMsgType
 import asyncio
+import inspect
 import json
 import random
-import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from enum import Enum
+from functools import lru_cache
+from itertools import islice
+from urllib.parse import urlsplit
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
@@ -15,17 +19,100 @@ from homeassistant import config_entries
 from datetime import timedelta
 import logging
 
-from Crypto.Cipher import DES
-from Crypto.Util.Padding import pad
+from cryptography.hazmat.primitives.ciphers import Cipher, modes
+try:
+    from cryptography.hazmat.decrepit.ciphers.algorithms import TripleDES
+except ImportError:  # cryptography < 43
+    from cryptography.hazmat.primitives.ciphers.algorithms import TripleDES
 from base64 import b64encode
 from binascii import unhexlify
 
-from .const import DOMAIN
+try:
+    import orjson
+except ImportError:  # orjson ships with Home Assistant; fall back to stdlib json otherwise
+    orjson = None
+
+from .const import DEFAULT_MODEL, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+if orjson is not None:
+    json_loads = orjson.loads
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize to a JSON string; the printer only accepts text frames."""
+        return orjson.dumps(obj).decode()
+else:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
 # Endpoint URL for sending data to stats
 ENDPOINT_URL = "https://faas-nyc1-2ef2e6cc.doserverless.co/api/v1/web/fn-21a02825-e6a2-4937-96fc-5aa2163df723/v1/creality-control"
+ENDPOINT_HEADERS = {"Content-Type": "application/json"}
+ENDPOINT_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Coordinator poll cadence; relaxed while the WebSocket is pushing updates
+POLL_INTERVAL = timedelta(seconds=30)
+STREAMING_POLL_INTERVAL = timedelta(seconds=300)
+
+# Newer aiohttp can hand TEXT frames over undecoded; both json_loads variants accept bytes
+WS_CONNECT_KWARGS = (
+    {"decode_text": False}
+    if "decode_text" in inspect.signature(aiohttp.ClientSession.ws_connect).parameters
+    else {}
+)
+
+# Printer family implied by the WebSocket port, used when frames carry no model
+PORT_MODEL = {
+    9999: "K1 Series (FDM)",
+    18188: "Halot Series (Resin)",
+}
+MODEL_KEYS = ("model", "printerModel")
+
+def _resolve_model(data, fallback):
+    """Return the printer model reported in data, else the port-based fallback."""
+    return data.get("model") or data.get("printerModel") or fallback or DEFAULT_MODEL
+
+# Cap on concurrent discovery probes across SSDP discovery and the config flow
+PROBE_SEMAPHORE = asyncio.Semaphore(32)
+
+# Longest a caller waits for its frame to be written to the socket, in seconds
+SEND_TIMEOUT = 10
+
+# Window for coalescing bursts of status frames into one entity update, in seconds
+LISTENER_DEBOUNCE = 0.1
+
+# Commands sent often enough to be worth serializing once per client
+KNOWN_COMMANDS = (
+    "GET_PRINT_STATUS",
+    "PRINT_PAUSE",
+    "PRINT_STOP",
+    "G28",
+    "G28 X",
+    "G28 Y",
+    "G28 Z",
+    "M112",
+    "M960 S1",
+    "M960 S0",
+    "M960 P1",
+    "M960 P0",
+)
+
+# The token key is fixed; three identical DES keys make 3DES-EDE equivalent to single DES-ECB
+_TOKEN_CIPHER = Cipher(TripleDES(unhexlify("6138356539643638") * 3), modes.ECB())
+
+@lru_cache(maxsize=32)
+def _make_token(password: str) -> str:
+    """Generate the authentication token for a printer password."""
+    if not password:
+        password = ""
+    
+    encryptor = _TOKEN_CIPHER.encryptor()
+    data = password.encode()
+    pad_len = 8 - len(data) % 8
+    padded_password = data + bytes([pad_len]) * pad_len
+    encrypted_password = encryptor.update(padded_password) + encryptor.finalize()
+    return b64encode(encrypted_password).decode('utf-8')
 
 class ConnectionState(Enum):
     """WebSocket connection states."""
@@ -38,12 +125,28 @@ class ConnectionState(Enum):
 class CrealityWebSocketClient:
     """Robust WebSocket client with reconnection and heartbeat."""
     
-    def __init__(self, host: str, port: int, password: str, coordinator: 'CrealityDataCoordinator'):
+    __slots__ = (
+        "host", "port", "password", "coordinator", "session", "ws", "state",
+        "last_message_time", "reconnect_attempts", "max_reconnect_attempts",
+        "base_reconnect_delay", "max_reconnect_delay", "heartbeat_interval",
+        "receive_timeout", "stale_threshold", "_loop", "_task", "_sender_task",
+        "_send_queue", "_pending_poll", "_flush_handle", "_stale_handle", "_shutdown", "_token",
+        "_frames", "_detected_model", "_backoff_schedule", "_uri", "_connect_timeout",
+        "_changed_keys",
+    )
+    
+    def __init__(self, host: str, port: int, password: str, coordinator: 'CrealityDataCoordinator',
+                 session: Optional[aiohttp.ClientSession] = None):
         self.host = host
         self.port = port
         self.password = password
+        self._detected_model = PORT_MODEL.get(port)
+        self._uri = f"ws://{host}:{port}/"
+        self._connect_timeout = aiohttp.ClientTimeout(total=15, connect=10)
         self.coordinator = coordinator
-        self.session: Optional[aiohttp.ClientSession] = None
+        # Monotonic clock for heartbeat/stale bookkeeping
+        self._loop = coordinator.hass.loop
+        self.session: Optional[aiohttp.ClientSession] = session
         self.ws: Optional[aiohttp.ClientWebSocketResponse] = None
         self.state = ConnectionState.DISCONNECTED
         self.last_message_time = 0.0
@@ -51,11 +154,28 @@ class CrealityWebSocketClient:
         self.max_reconnect_attempts = 10
         self.base_reconnect_delay = 1.0
         self.max_reconnect_delay = 60.0
+        # Delay ceiling for each attempt, capped at max_reconnect_delay
+        self._backoff_schedule = tuple(
+            min(self.base_reconnect_delay * (1 << attempt), self.max_reconnect_delay)
+            for attempt in range(self.max_reconnect_attempts)
+        )
         self.heartbeat_interval = 20.0
         self.receive_timeout = 60.0
         self.stale_threshold = 90.0
         self._task: Optional[asyncio.Task] = None
+        self._sender_task: Optional[asyncio.Task] = None
+        self._send_queue: asyncio.Queue = asyncio.Queue()
+        self._pending_poll: Optional[asyncio.Future] = None
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._stale_handle: Optional[asyncio.TimerHandle] = None
+        # Keys changed since the last listener flush; None when every entity must refresh
+        self._changed_keys: Optional[set] = set()
         self._shutdown = False
+        # The password is fixed for the lifetime of the client, so the token is too
+        self._token = _make_token(password)
+        self._frames = {
+            cmd: json_dumps({"cmd": cmd, "token": self._token}) for cmd in KNOWN_COMMANDS
+        }
         
     async def start(self) -> None:
         """Start the WebSocket client."""
@@ -63,32 +183,66 @@ class CrealityWebSocketClient:
             return
             
         self._shutdown = False
+        if not self.session or self.session.closed:
+            self.session = async_get_clientsession(self.coordinator.hass)
         self._task = asyncio.create_task(self._run())
+        self._ensure_sender()
+
+    def _ensure_sender(self) -> None:
+        """Start the sender task unless it is already running."""
+        if not self._sender_task or self._sender_task.done():
+            self._sender_task = asyncio.create_task(self._sender_loop())
         
     async def stop(self) -> None:
         """Stop the WebSocket client."""
         self._shutdown = True
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._task, self._sender_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        while not self._send_queue.empty():
+            _, fut = self._send_queue.get_nowait()
+            if fut is not None and not fut.done():
+                fut.set_exception(ConnectionError("WebSocket client stopped"))
+        for handle in (self._flush_handle, self._stale_handle):
+            if handle:
+                handle.cancel()
+        self._flush_handle = self._stale_handle = None
         await self._disconnect()
         
+    def _command_frame(self, command: str) -> str:
+        """Return the encoded frame for a command."""
+        frame = self._frames.get(command)
+        if frame is None:
+            # Commands come from a fixed set of entities, so cache on first use
+            frame = self._frames[command] = json_dumps({"cmd": command, "token": self._token})
+        return frame
+
+    def send_command_nowait(self, command: str) -> bool:
+        """Queue a command for the printer without waiting for it to be written."""
+        if self.state != ConnectionState.CONNECTED or not self.ws or self.ws.closed:
+            _LOGGER.warning("Cannot send command %s: WebSocket not connected", command)
+            return False
+
+        self._send_queue.put_nowait((self._command_frame(command), None))
+        _LOGGER.debug("Queued command %s for printer", command)
+        return True
+
     async def send_command(self, command: str) -> bool:
-        """Send a command to the printer."""
+        """Send a command to the printer and wait until it is written."""
         if self.state != ConnectionState.CONNECTED or not self.ws or self.ws.closed:
-            _LOGGER.warning(f"Cannot send command {command}: WebSocket not connected")
+            _LOGGER.warning("Cannot send command %s: WebSocket not connected", command)
             return False
             
         try:
-            token = self._generate_token(self.password)
-            await self.ws.send_json({"cmd": command, "token": token})
-            _LOGGER.info(f"Sent command {command} to printer")
+            await self._enqueue(self._command_frame(command))
+            _LOGGER.info("Sent command %s to printer", command)
             return True
         except Exception as e:
-            _LOGGER.error(f"Failed to send command {command}: {e}")
+            _LOGGER.error("Failed to send command %s: %s", command, e)
             return False
     
     async def send_json(self, payload: dict) -> bool:
@@ -98,35 +252,70 @@ class CrealityWebSocketClient:
             return False
             
         try:
-            await self.ws.send_json(payload)
-            _LOGGER.debug(f"Sent JSON payload: {payload}")
+            await self._enqueue(json_dumps(payload))
+            _LOGGER.debug("Sent JSON payload: %s", payload)
             return True
         except Exception as e:
-            _LOGGER.error(f"Failed to send JSON payload: {e}")
+            _LOGGER.error("Failed to send JSON payload: %s", e)
             return False
             
-    def _generate_token(self, password: str) -> str:
-        """Generate authentication token."""
-        if not password:
-            password = ""
-        
-        key = unhexlify("6138356539643638")
-        cipher = DES.new(key[:8], DES.MODE_ECB)
-        padded_password = pad(password.encode(), DES.block_size)
-        encrypted_password = cipher.encrypt(padded_password)
-        token = b64encode(encrypted_password).decode('utf-8')
-        return token
+    async def _enqueue(self, frame: str) -> bool:
+        """Queue a text frame for the sender task and wait until it is written."""
+        fut = self._loop.create_future()
+        self._send_queue.put_nowait((frame, fut))
+        # wait_for cancels the future on timeout, so the sender skips the frame
+        return await asyncio.wait_for(fut, SEND_TIMEOUT)
         
+    async def _sender_loop(self) -> None:
+        """Write queued frames to the socket one at a time, in queue order."""
+        while True:
+            frame, fut = await self._send_queue.get()
+            if fut is not None and fut.done():
+                continue
+            try:
+                if not self.ws or self.ws.closed:
+                    raise ConnectionError("WebSocket not connected")
+                await self.ws.send_str(frame)
+            except Exception as e:
+                if fut is None:
+                    # Nobody is waiting on fire-and-forget frames, so report here
+                    _LOGGER.warning("Failed to send queued command: %s", e)
+                elif not fut.done():
+                    fut.set_exception(e)
+            else:
+                # The caller may have timed out while the write was in progress
+                if fut is not None and not fut.done():
+                    fut.set_result(True)
+            finally:
+                # Cancelled mid-write by stop(): never leave the caller waiting
+                if fut is not None and not fut.done():
+                    fut.set_exception(ConnectionError("WebSocket client stopped"))
+            
+    async def request_status(self, timeout: float = 10.0) -> Optional[Dict[str, Any]]:
+        """Request a status frame over the open connection and wait for the reply."""
+        if not self.ws or self.ws.closed:
+            return None
+            
+        self._pending_poll = self._loop.create_future()
+        try:
+            await self._enqueue(self._frames["GET_PRINT_STATUS"])
+            return await asyncio.wait_for(self._pending_poll, timeout)
+        finally:
+            self._pending_poll = None
+            
     async def _run(self) -> None:
         """Main WebSocket loop with reconnection logic."""
         while not self._shutdown:
             try:
                 await self._connect()
                 await self._message_loop()
+                if not self._shutdown:
+                    # The socket closed or timed out without raising; reconnect with backoff
+                    await self._handle_connection_error()
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                _LOGGER.error(f"WebSocket error: {e}")
+                _LOGGER.error("WebSocket error: %s", e)
                 await self._handle_connection_error()
                 
     async def _connect(self) -> None:
@@ -135,31 +324,29 @@ class CrealityWebSocketClient:
             return
             
         self._set_state(ConnectionState.CONNECTING)
-        _LOGGER.info(f"🔌 Connecting to WebSocket at {self.host}:{self.port}")
-        
-        if not self.session or self.session.closed:
-            self.session = async_get_clientsession(self.coordinator.hass)
-            
-        uri = f"ws://{self.host}:{self.port}/"
-        timeout = aiohttp.ClientTimeout(total=15, connect=10)
+        _LOGGER.info("🔌 Connecting to WebSocket at %s:%s", self.host, self.port)
         
         try:
             self.ws = await self.session.ws_connect(
-                uri,
-                timeout=timeout,
+                self._uri,
+                timeout=self._connect_timeout,
                 heartbeat=20,  # Send ping every 20 seconds
-                receive_timeout=self.receive_timeout
+                receive_timeout=self.receive_timeout,
+                **WS_CONNECT_KWARGS
             )
             self._set_state(ConnectionState.CONNECTED)
+            # Frames are only written while connected, so make sure someone writes them
+            self._ensure_sender()
             self.reconnect_attempts = 0
-            self.last_message_time = time.time()
-            _LOGGER.info(f"Connected to Creality printer at {self.host}:{self.port}")
+            self.last_message_time = self._loop.time()
+            self._schedule_stale_check()
+            _LOGGER.info("Connected to Creality printer at %s:%s", self.host, self.port)
             
         except (aiohttp.ClientConnectorError, aiohttp.WSServerHandshakeError) as e:
-            _LOGGER.warning(f"Connection failed: {e}")
+            _LOGGER.warning("Connection failed: %s", e)
             raise
         except Exception as e:
-            _LOGGER.error(f"Unexpected connection error: {e}")
+            _LOGGER.error("Unexpected connection error: %s", e)
             raise
             
     async def _message_loop(self) -> None:
@@ -171,73 +358,111 @@ class CrealityWebSocketClient:
             # Send initial status request
             await self.send_command("GET_PRINT_STATUS")
             
-            async for msg in self.ws:
-                if self._shutdown:
-                    break
-                    
-                if msg.type == aiohttp.WSMsgType.TEXT:
+            # Read frames directly rather than through the async iterator wrapper
+            receive = self.ws.receive
+            while not self._shutdown:
+                msg = await receive()
+                
+                # WSMsgType members are singletons; TEXT is by far the most common frame
+                msg_type = msg.type
+                if msg_type is WSMsgType.TEXT:
                     try:
-                        data = json.loads(msg.data)
+                        data = json_loads(msg.data)
                         await self._handle_message(data)
                     except json.JSONDecodeError as e:
-                        _LOGGER.warning(f"Invalid JSON received: {e}")
+                        _LOGGER.warning("Invalid JSON received: %s", e)
                         continue
-                elif msg.type == aiohttp.WSMsgType.ERROR:
-                    _LOGGER.error(f"WebSocket error: {self.ws.exception()}")
+                elif msg_type is WSMsgType.ERROR:
+                    _LOGGER.error("WebSocket error: %s", self.ws.exception())
                     break
-                elif msg.type == aiohttp.WSMsgType.CLOSE:
+                elif msg_type is WSMsgType.CLOSE or msg_type is WSMsgType.CLOSING or msg_type is WSMsgType.CLOSED:
                     _LOGGER.info("WebSocket connection closed")
                     break
-                elif msg.type == aiohttp.WSMsgType.PING:
+                elif msg_type is WSMsgType.PING:
                     _LOGGER.debug("Received ping")
-                elif msg.type == aiohttp.WSMsgType.PONG:
+                elif msg_type is WSMsgType.PONG:
                     _LOGGER.debug("Received pong")
                     
         except asyncio.TimeoutError:
             _LOGGER.warning("WebSocket receive timeout")
         except Exception as e:
-            _LOGGER.error(f"Message loop error: {e}")
+            _LOGGER.error("Message loop error: %s", e)
             raise
             
     async def _handle_message(self, data: Dict[str, Any]) -> None:
         """Handle incoming WebSocket message."""
-        self.last_message_time = time.time()
+        self.last_message_time = self._loop.time()
+        if self.state is ConnectionState.STALE:
+            # Data is flowing again on the same socket
+            self._set_state(ConnectionState.CONNECTED)
+            self._schedule_stale_check()
         
-        _LOGGER.info(f"🔍 _handle_message called with {len(data) if data else 0} fields")
-        _LOGGER.info(f"🔍 coordinator.data exists: {bool(self.coordinator.data)}")
+        _LOGGER.debug("🔍 _handle_message called with %d fields (coordinator data: %s)",
+                      len(data) if data else 0, bool(self.coordinator.data))
         
         # Update coordinator data
         if data:
-            # Try to detect printer model if not present
-            if "model" not in data and "printerModel" not in data:
-                if self.port == 9999:
-                    data["detected_model"] = "K1 Series (FDM)"
-                elif self.port == 18188:
-                    data["detected_model"] = "Halot Series (Resin)"
-            
             # Merge with existing data instead of replacing
+            changed = data
             if self.coordinator.data:
-                # Merge new data with existing data
-                self.coordinator.data.update(data)
+                # Merge only the fields that differ from what we already have
+                current = self.coordinator.data
+                changed = {
+                    key: value for key, value in data.items()
+                    if key not in current or current[key] != value
+                }
+                if changed:
+                    # Publish a new dict so readers holding the previous snapshot never see it mutate
+                    merged = {**current, **changed}
+                    if any(key in changed for key in MODEL_KEYS):
+                        merged["detected_model"] = _resolve_model(merged, self._detected_model)
+                    self.coordinator.data = merged
             else:
                 # First message - set the full dataset
+                data["detected_model"] = _resolve_model(data, self._detected_model)
                 self.coordinator.data = data
                 _LOGGER.info("🚀 First WebSocket message - sending raw data to endpoint")
-                _LOGGER.info(f"Data keys: {list(data.keys())}")
-                await self._send_raw_data_to_endpoint(data)
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Data keys: %s", list(data))
+                # The upload is not needed for setup; keep it off the message loop
+                self.coordinator.hass.async_create_background_task(
+                    self._send_raw_data_to_endpoint(data), f"{DOMAIN} raw data upload"
+                )
             
-            self.coordinator.last_update_success = True
-            self.coordinator.last_update_time = time.time()
-            self.coordinator.async_update_listeners()
+            if changed and self._changed_keys is not None:
+                self._changed_keys.update(changed)
+            
+            # Repeated status frames are common; only fan out to entities when something changed
+            if changed or not self.coordinator.last_update_success:
+                self.coordinator.last_update_success = True
+                if self._flush_handle is None:
+                    self._flush_handle = self._loop.call_later(LISTENER_DEBOUNCE, self._flush_listeners)
+            self.coordinator.last_update_time = self._loop.time()
+            if self.coordinator.update_interval != STREAMING_POLL_INTERVAL:
+                self.coordinator.update_interval = STREAMING_POLL_INTERVAL
+            
+            if self._pending_poll is not None and not self._pending_poll.done():
+                self._pending_poll.set_result(data)
             
             # Debug logging for key values
-            _LOGGER.debug(f"WebSocket data received: {len(data)} fields, total data: {len(self.coordinator.data)} fields")
-            if "nozzleTemp" in data:
-                _LOGGER.debug(f"Nozzle temp: {data['nozzleTemp']}")
-            if "bedTemp0" in data:
-                _LOGGER.debug(f"Bed temp: {data['bedTemp0']}")
-            if "printProgress" in data:
-                _LOGGER.debug(f"Progress: {data['printProgress']}")
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("WebSocket data received: %d fields, total data: %d fields", len(data), len(self.coordinator.data))
+                if "nozzleTemp" in data:
+                    _LOGGER.debug("Nozzle temp: %s", data['nozzleTemp'])
+                if "bedTemp0" in data:
+                    _LOGGER.debug("Bed temp: %s", data['bedTemp0'])
+                if "printProgress" in data:
+                    _LOGGER.debug("Progress: %s", data['printProgress'])
+    
+    def _flush_listeners(self) -> None:
+        """Notify entities once for all frames received in the debounce window."""
+        self._flush_handle = None
+        self.coordinator.changed_keys, self._changed_keys = self._changed_keys, set()
+        try:
+            self.coordinator.async_update_listeners()
+        finally:
+            # Updates from any other source may touch every key
+            self.coordinator.changed_keys = None
     
     async def _send_raw_data_to_endpoint(self, data: Dict[str, Any]) -> None:
         """Send raw websocket data to the endpoint for Stats upload."""
@@ -247,34 +472,35 @@ class CrealityWebSocketClient:
                 "data": data
             }
             
-            _LOGGER.info(f"📤 Sending raw websocket data to endpoint: {len(data)} fields")
-            _LOGGER.info(f"📤 Endpoint URL: {ENDPOINT_URL}")
-            _LOGGER.info(f"📤 Sample data keys: {list(data.keys())[:10]}...")  # Show first 10 keys
+            _LOGGER.info("📤 Sending raw websocket data to endpoint: %s fields", len(data))
+            _LOGGER.info("📤 Endpoint URL: %s", ENDPOINT_URL)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("📤 Sample data keys: %s...", list(islice(data, 10)))  # Show first 10 keys
             
             # Send to endpoint
-            session = async_get_clientsession(self.coordinator.hass)
             _LOGGER.info("📤 Making HTTP POST request...")
             
-            async with session.post(
+            async with self.coordinator.session.post(
                 ENDPOINT_URL,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=aiohttp.ClientTimeout(total=10)
+                data=json_dumps(payload),
+                headers=ENDPOINT_HEADERS,
+                timeout=ENDPOINT_TIMEOUT
             ) as response:
-                _LOGGER.info(f"📤 Response received - Status: {response.status}")
+                _LOGGER.info("📤 Response received - Status: %s", response.status)
                 
                 if response.status == 200:
-                    result = await response.json()
-                    _LOGGER.info(f"✅ Successfully sent raw printer data to endpoint. Response: {result}")
+                    _LOGGER.info("✅ Successfully sent raw printer data to endpoint")
+                    # The reply body is only of interest when debugging
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug("Endpoint response: %s", await response.text())
                 else:
                     response_text = await response.text()
-                    _LOGGER.warning(f"❌ Endpoint returned status {response.status}: {response_text}")
+                    _LOGGER.warning("❌ Endpoint returned status %s: %s", response.status, response_text)
                     
         except Exception as e:
-            _LOGGER.error(f"❌ Failed to send raw data to endpoint: {e}")
-            _LOGGER.error(f"❌ Exception type: {type(e).__name__}")
-            import traceback
-            _LOGGER.error(f"❌ Traceback: {traceback.format_exc()}")
+            # Attach the traceback only when debug logging is enabled
+            _LOGGER.error("❌ Failed to send raw data to endpoint: %s (%s)", e, type(e).__name__,
+                          exc_info=_LOGGER.isEnabledFor(logging.DEBUG))
     
     async def force_send_data_to_endpoint(self) -> None:
         """Force send current data to endpoint (for testing)."""
@@ -287,33 +513,30 @@ class CrealityWebSocketClient:
     async def _handle_connection_error(self) -> None:
         """Handle connection errors with exponential backoff."""
         await self._disconnect()
+        self.coordinator.update_interval = POLL_INTERVAL
         
         if self._shutdown:
             return
             
-        if self.reconnect_attempts >= self.max_reconnect_attempts:
-            _LOGGER.error("Max reconnection attempts reached")
-            self._set_state(ConnectionState.DISCONNECTED)
-            return
+        if self.reconnect_attempts == self.max_reconnect_attempts:
+            # Keep retrying at the slowest backoff rather than re-entering _connect without a delay
+            _LOGGER.error("Max reconnection attempts reached, retrying every %.0fs at most", self.max_reconnect_delay)
             
         self._set_state(ConnectionState.RECONNECTING)
-        self.reconnect_attempts += 1
         
-        # Exponential backoff with jitter
-        delay = min(
-            self.base_reconnect_delay * (2 ** self.reconnect_attempts),
-            self.max_reconnect_delay
-        )
-        jitter = random.uniform(0.1, 0.5) * delay
-        total_delay = delay + jitter
+        # Exponential backoff with full jitter so clients don't reconnect in lockstep
+        delay = self._backoff_schedule[min(self.reconnect_attempts, len(self._backoff_schedule) - 1)]
+        total_delay = delay * random.random()
+        self.reconnect_attempts += 1
         
-        _LOGGER.info(f"Reconnecting in {total_delay:.1f}s (attempt {self.reconnect_attempts})")
+        _LOGGER.info("Reconnecting in %.1fs (attempt %s)", total_delay, self.reconnect_attempts)
         await asyncio.sleep(total_delay)
         
     async def _disconnect(self) -> None:
         """Disconnect WebSocket."""
-        if self.ws and not self.ws.closed:
-            await self.ws.close()
+        ws, self.ws = self.ws, None
+        if ws and not ws.closed:
+            await ws.close()
         self._set_state(ConnectionState.DISCONNECTED)
         
     def _set_state(self, new_state: ConnectionState) -> None:
@@ -321,20 +544,43 @@ class CrealityWebSocketClient:
         if self.state != new_state:
             old_state = self.state
             self.state = new_state
-            _LOGGER.info(f"Connection state: {old_state.value} -> {new_state.value}")
+            _LOGGER.info("Connection state: %s -> %s", old_state.value, new_state.value)
+            healthy = new_state is ConnectionState.CONNECTED
+            if healthy != self.coordinator.healthy:
+                # Publish health on transitions so entities read a plain attribute
+                self.coordinator.healthy = healthy
+                self._changed_keys = None
+                if not self._shutdown and self._flush_handle is None:
+                    self._flush_handle = self._loop.call_later(LISTENER_DEBOUNCE, self._flush_listeners)
             
+    def _schedule_stale_check(self) -> None:
+        """Run is_healthy once stale_threshold passes without a message."""
+        if self._stale_handle:
+            self._stale_handle.cancel()
+        delay = self.last_message_time + self.stale_threshold - self._loop.time()
+        self._stale_handle = self._loop.call_later(max(delay, 0.0), self._check_stale)
+
+    def _check_stale(self) -> None:
+        """Catch a printer that stopped sending status while heartbeats keep the socket open."""
+        self._stale_handle = None
+        if self.is_healthy():
+            self._schedule_stale_check()
+        elif self.state is ConnectionState.STALE:
+            # Resume polling now rather than at the end of the streaming interval
+            self.coordinator.hass.async_create_task(self.coordinator.async_request_refresh())
+
     def is_healthy(self) -> bool:
         """Check if connection is healthy."""
-        if self.state != ConnectionState.CONNECTED:
+        # STALE and every other non-connected state answer without reading the clock
+        if self.state is not ConnectionState.CONNECTED:
             return False
             
-        current_time = time.time()
-        time_since_last_message = current_time - self.last_message_time
+        time_since_last_message = self._loop.time() - self.last_message_time
         
         if time_since_last_message > self.stale_threshold:
-            if self.state != ConnectionState.STALE:
-                self._set_state(ConnectionState.STALE)
-                _LOGGER.warning(f"Connection stale: no data for {time_since_last_message:.1f}s")
+            self._set_state(ConnectionState.STALE)
+            self.coordinator.update_interval = POLL_INTERVAL
+            _LOGGER.warning("Connection stale: no data for %.1fs", time_since_last_message)
             return False
             
         return True
@@ -347,11 +593,21 @@ class CrealityDataCoordinator(DataUpdateCoordinator):
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=30)
+            update_interval=POLL_INTERVAL
         )
         self.config = config
+        self.session = async_get_clientsession(hass)
         self.ws_client: Optional[CrealityWebSocketClient] = None
+        # Whether the WebSocket is connected; kept current by the client on state changes
+        self.healthy = False
+        # Data keys changed by the WebSocket update being dispatched; None means unknown
+        self.changed_keys: Optional[set] = None
         self._setup_task: Optional[asyncio.Task] = None
+        self._token = _make_token(config['password'])
+        self._detected_model = PORT_MODEL.get(config['port'])
+        # Keys with a "set" frame being written, and the newest value waiting behind each
+        self._set_in_flight: set = set()
+        self._pending_set: Dict[str, Tuple[Any, asyncio.Future]] = {}
         
     async def async_config_entry_first_refresh(self) -> None:
         """Initialize WebSocket connection on first refresh."""
@@ -367,7 +623,8 @@ class CrealityDataCoordinator(DataUpdateCoordinator):
             self.config['host'],
             self.config['port'],
             self.config['password'],
-            self
+            self,
+            session=self.session
         )
         
         self._setup_task = asyncio.create_task(self.ws_client.start())
@@ -388,44 +645,41 @@ class CrealityDataCoordinator(DataUpdateCoordinator):
     async def _poll_data(self) -> Dict[str, Any]:
         """Fallback polling method when WebSocket is unavailable."""
         try:
-            session = async_get_clientsession(self.hass)
+            # Use the client's socket; while it is reconnecting, leave that to the
+            # client instead of dialing a throwaway connection on every poll
+            if self.ws_client:
+                msg = await self.ws_client.request_status()
+                if msg:
+                    return self.data or msg
+                raise UpdateFailed("WebSocket not connected, waiting for reconnect")
+            
+            # No client yet (first refresh): fetch one status frame directly
             uri = f"ws://{self.config['host']}:{self.config['port']}/"
-            token = self._generate_token(self.config['password'])
             
-            async with session.ws_connect(uri, timeout=aiohttp.ClientTimeout(total=10)) as ws:
-                await ws.send_json({"cmd": "GET_PRINT_STATUS", "token": token})
-                async with asyncio.timeout(10):
-                    msg = await ws.receive_json()
-                    if msg:
-                        # Try to detect printer model if not present
-                        if "model" not in msg and "printerModel" not in msg:
-                            if self.config['port'] == 9999:
-                                msg["detected_model"] = "K1 Series (FDM)"
-                            elif self.config['port'] == 18188:
-                                msg["detected_model"] = "Halot Series (Resin)"
-                        return msg
+            async with self.session.ws_connect(uri, timeout=aiohttp.ClientTimeout(total=10), **WS_CONNECT_KWARGS) as ws:
+                await ws.send_json({"cmd": "GET_PRINT_STATUS", "token": self._token}, dumps=json_dumps)
+                msg = await ws.receive_json(loads=json_loads, timeout=10)
+                if msg:
+                    # Publish the normalized model once so entities read a single key
+                    msg["detected_model"] = _resolve_model(msg, self._detected_model)
+                    return msg
         except Exception as e:
-            _LOGGER.error(f"Polling failed: {e}")
+            _LOGGER.error("Polling failed: %s", e)
             raise UpdateFailed(f"Failed to fetch data: {e}")
             
-    def _generate_token(self, password: str) -> str:
-        """Generate authentication token."""
-        if not password:
-            password = ""
-        
-        key = unhexlify("6138356539643638")
-        cipher = DES.new(key[:8], DES.MODE_ECB)
-        padded_password = pad(password.encode(), DES.block_size)
-        encrypted_password = cipher.encrypt(padded_password)
-        token = b64encode(encrypted_password).decode('utf-8')
-        return token
-        
     async def send_command(self, command: str) -> bool:
         """Send a command to the printer."""
         if not self.ws_client:
             _LOGGER.warning("WebSocket client not available")
             return False
         return await self.ws_client.send_command(command)
+
+    def send_command_nowait(self, command: str) -> bool:
+        """Queue a command for the printer without waiting for the write."""
+        if not self.ws_client:
+            _LOGGER.warning("WebSocket client not available")
+            return False
+        return self.ws_client.send_command_nowait(command)
     
     async def send_temp_command(self, temp_type: str, temperature: int) -> bool:
         """Send a temperature control command to the printer."""
@@ -438,11 +692,41 @@ class CrealityDataCoordinator(DataUpdateCoordinator):
         elif temp_type == "bed":
             command = {"method": "set", "params": {"bedTempControl": {"num": 0, "val": temperature}}}
         else:
-            _LOGGER.error(f"Invalid temperature type: {temp_type}")
+            _LOGGER.error("Invalid temperature type: %s", temp_type)
             return False
         
         return await self.ws_client.send_json(command)
     
+    async def send_set_param(self, key: str, value: Any) -> bool:
+        """Send a single-key "set" frame, collapsing rapid repeats of the same key.
+        
+        The printer only documents one parameter per "set" frame, so keys are never
+        merged. While a frame for a key is being written, later values for that key
+        replace each other and only the newest is sent once the write finishes.
+        """
+        if not self.ws_client:
+            _LOGGER.warning("WebSocket client not available")
+            return False
+        
+        if key in self._set_in_flight:
+            pending = self._pending_set.get(key)
+            future = pending[1] if pending else self.hass.loop.create_future()
+            self._pending_set[key] = (value, future)
+            return await future
+        
+        self._set_in_flight.add(key)
+        try:
+            success = await self.ws_client.send_json({"method": "set", "params": {key: value}})
+            while key in self._pending_set:
+                value, future = self._pending_set.pop(key)
+                future.set_result(await self.ws_client.send_json({"method": "set", "params": {key: value}}))
+        finally:
+            self._set_in_flight.discard(key)
+            pending = self._pending_set.pop(key, None)
+            if pending and not pending[1].done():
+                pending[1].set_result(False)
+        return success
+    
     async def send_websocket_command(self, command: dict) -> bool:
         """Send a WebSocket JSON command to the printer."""
         if not self.ws_client:
@@ -452,6 +736,10 @@ class CrealityDataCoordinator(DataUpdateCoordinator):
         
     async def async_unload(self) -> None:
         """Clean up resources on unload."""
+        for _, future in self._pending_set.values():
+            if not future.done():
+                future.set_result(False)
+        self._pending_set.clear()
         if self.ws_client:
             await self.ws_client.stop()
         if self._setup_task and not self._setup_task.done():
@@ -492,8 +780,8 @@ def async_register_static_paths(hass: HomeAssistant) -> None:
     import os
     # Register the images directory for serving product images
     images_path = os.path.join(hass.config.config_dir, "custom_components", DOMAIN, "images")
-    _LOGGER.info(f"Registering static path: /{DOMAIN}/images -> {images_path}")
-    _LOGGER.info(f"Images directory exists: {os.path.exists(images_path)}")
+    _LOGGER.info("Registering static path: /%s/images -> %s", DOMAIN, images_path)
+    _LOGGER.info("Images directory exists: %s", os.path.exists(images_path))
     
     # Use the correct Home Assistant API for static paths
     hass.http.register_static_path(
@@ -507,7 +795,7 @@ async def async_handle_ssdp_discovery(hass: HomeAssistant, discovery_info: dict)
     _LOGGER.info("SSDP discovery: %s", discovery_info)
     
     # Extract host from discovery info
-    host = discovery_info.get("ssdp_location", "").replace("http://", "").split("/")[0]
+    host = urlsplit(discovery_info.get("ssdp_location", "")).hostname
     if not host:
         return
     
@@ -532,31 +820,57 @@ async def _detect_creality_port(hass: HomeAssistant, host: str) -> int | None:
     """Detect which port the Creality printer is using."""
     # Try common Creality ports
     ports_to_try = [9999, 18188, 8080, 80]
+    session = async_get_clientsession(hass)
     
-    for port in ports_to_try:
-        if await _test_creality_connection(hass, host, port):
-            return port
+    # Probe all ports at once and take the first that answers
+    tasks = {
+        asyncio.create_task(_test_creality_connection(session, host, port)): port
+        for port in ports_to_try
+    }
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.result():
+                    return tasks[task]
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            # Let the losing probes unwind so their sockets and semaphore slots are released
+            await asyncio.gather(*pending, return_exceptions=True)
     
     return None
 
-async def _test_creality_connection(hass: HomeAssistant, host: str, port: int) -> bool:
+async def _test_creality_connection(session: aiohttp.ClientSession, host: str, port: int) -> bool:
     """Test if a Creality printer is responding on the given host:port."""
-    try:
-        session = async_get_clientsession(hass)
-        uri = f"ws://{host}:{port}/"
-        
-        async with session.ws_connect(uri, timeout=aiohttp.ClientTimeout(total=5)) as ws:
-            # Send a simple test command
-            await ws.send_json({"cmd": "GET_PRINT_STATUS", "token": ""})
-            
-            # Try to receive a response
-            try:
-                async with asyncio.timeout(3):
-                    response = await ws.receive_json()
+    async with PROBE_SEMAPHORE:
+        # Plain TCP connect first so closed ports fail fast without a WebSocket handshake
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=1.0)
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+
+        try:
+            uri = f"ws://{host}:{port}/"
+
+            async with session.ws_connect(uri, timeout=aiohttp.ClientTimeout(total=5), **WS_CONNECT_KWARGS) as ws:
+                # Send a simple test command
+                await ws.send_json({"cmd": "GET_PRINT_STATUS", "token": ""}, dumps=json_dumps)
+
+                # Try to receive a response
+                try:
+                    response = await ws.receive_json(loads=json_loads, timeout=3)
                     # If we get any response, it's likely a Creality printer
                     return True
-            except (asyncio.TimeoutError, aiohttp.WSMsgType):
-                return False
-                
-    except Exception:
-        return False
\ No newline at end of file
+                except asyncio.TimeoutError:
+                    return False
+
+        except Exception:
+            return False
\ No newline at end of file
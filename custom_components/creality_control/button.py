@@ -3,6 +3,7 @@ from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry  
 from homeassistant.core import HomeAssistant
 from .const import DOMAIN
+from .entity import CrealityDeviceInfoMixin
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,76 +37,28 @@ async def async_setup_entry(hass, entry, async_add_entities):
     
     async_add_entities(buttons)
 
-class CrealityControlButton(ButtonEntity):
+class CrealityControlButton(CrealityDeviceInfoMixin, ButtonEntity):
     """Defines a Creality Control button."""
 
+    # Buttons have no state to refresh
+    _attr_should_poll = False
+
     def __init__(self, coordinator, name, command):
         super().__init__()
         self.coordinator = coordinator
         self._attr_name = name
         self._command = command
-        self._attr_unique_id = f"{coordinator.config['host']}_{command}"
+        host = coordinator.config['host']
+        self._attr_unique_id = f"{host}_{command}"
+        self._init_device_info(host)
+
+    async def async_added_to_hass(self):
+        """Rebuild device info when the coordinator reports new data."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_add_listener(self._recompute_device_info))
 
     async def async_press(self):
         """Handle the button press."""
-        success = await self.coordinator.send_command(self._command)
+        success = self.coordinator.send_command_nowait(self._command)
         if not success:
-            _LOGGER.warning(f"Failed to send command {self._command} - WebSocket may be disconnected")
-
-    @property
-    def device_info(self):
-        """Return information about the device this button is part of."""
-        # Try to detect printer model from data if available
-        model = "Creality Printer"
-        if self.coordinator.data:
-            if "model" in self.coordinator.data:
-                model = self.coordinator.data["model"]
-            elif "printerModel" in self.coordinator.data:
-                model = self.coordinator.data["printerModel"]
-            elif "detected_model" in self.coordinator.data:
-                model = self.coordinator.data["detected_model"]
-        
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.config['host'])},
-            "name": f"Creality {model}",
-            "manufacturer": "Creality",
-            "model": model,
-            "sw_version": self._parse_firmware_version(),
-            "suggested_area": "Workshop",
-            "configuration_url": f"http://{self.coordinator.config['host']}:80"
-        }
-
-    def _parse_firmware_version(self):
-        """Parse firmware version from modelVersion data."""
-        if not self.coordinator.data:
-            return "Unknown"
-            
-        raw_version = self.coordinator.data.get("modelVersion", "")
-        if not raw_version:
-            return "Unknown"
-        
-        # Parse the version string: "printer hw ver:;printer sw ver:;DWIN hw ver:CR4CU220812S11;DWIN sw ver:1.3.3.46;"
-        try:
-            # Split by semicolon and find the DWIN software version
-            parts = raw_version.split(';')
-            for part in parts:
-                if 'DWIN sw ver:' in part:
-                    version = part.replace('DWIN sw ver:', '').strip()
-                    if version:
-                        return version
-            
-            # If no DWIN version found, try to find any version
-            for part in parts:
-                if 'sw ver:' in part and part.replace('sw ver:', '').strip():
-                    version = part.replace('sw ver:', '').strip()
-                    if version:
-                        return version
-                        
-        except Exception:
-            pass
-        
-        # Fallback to raw version if parsing fails
-        return raw_version
-
-
-
+            _LOGGER.warning("Failed to send command %s - WebSocket may be disconnected", self._command)
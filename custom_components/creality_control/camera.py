@@ -1,14 +1,42 @@
 """Camera support for Creality K1C and other models with built-in cameras."""
 import asyncio
 import logging
+import re
+import time
+import aiohttp
 from homeassistant.components.camera import Camera
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .const import DOMAIN
+from .entity import CrealityDeviceInfoMixin
+from .util import EMPTY_DATA
 
 _LOGGER = logging.getLogger(__name__)
 
+# MJPEG part framing: --boundary\r\nContent-Type: image/jpeg\r\nContent-Length: XXXX\r\n\r\n[JPEG_DATA]
+# mjpg-streamer's delimiter, used when the response does not declare one
+MJPEG_BOUNDARY = b'--boundarydonotcross'
+MJPEG_BOUNDARY_RE = re.compile(r'boundary="?([^";]+)"?', re.IGNORECASE)
+MJPEG_HEADER_END = b'\r\n\r\n'
+MJPEG_CONTENT_LENGTH_RE = re.compile(rb'Content-Length:\s*(\d+)', re.IGNORECASE)
+MJPEG_MAX_BUFFER = 1024 * 1024
+
+# Headers that might be needed for MJPEG streams
+CAMERA_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Linux; Home Assistant)',
+    'Accept': 'image/jpeg, image/png, image/*',
+    'Connection': 'keep-alive',
+}
+# The background stream stays open, so only bound connect and per-read stalls
+CAMERA_STREAM_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=15)
+CAMERA_SNAPSHOT_TIMEOUT = aiohttp.ClientTimeout(total=5)
+# How long a fetched frame is served to other viewers before refetching, in seconds
+CAMERA_FRAME_TTL = 1.0
+# Wait for the first stream frame, and close the stream after this long without viewers, in seconds
+CAMERA_FIRST_FRAME_TIMEOUT = 15
+CAMERA_STREAM_IDLE = 5
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
     """Set up Creality camera from a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
@@ -16,222 +44,241 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     # Always add the camera entity - it will handle availability internally
     async_add_entities([CrealityCamera(coordinator)])
 
-class CrealityCamera(Camera):
+class CrealityCamera(CrealityDeviceInfoMixin, Camera):
     """Representation of a Creality printer camera."""
 
+    # State is written from coordinator updates instead of polling
+    _attr_should_poll = False
+    _attr_brand = "Creality"
+
     def __init__(self, coordinator):
         """Initialize the camera."""
         super().__init__()
         self.coordinator = coordinator
+        self._session = coordinator.session
+        self._snapshot_supported = None
+        self._frame = None
+        self._frame_time = 0.0
+        self._fetch_lock = asyncio.Lock()
+        self._reader_task = None
+        self._latest_frame = None
+        self._latest_frame_event = asyncio.Event()
+        self._last_request = 0.0
+        host = coordinator.config['host']
+        # Use the known working camera URLs
+        self._stream_url = f"http://{host}:8080/?action=stream"
+        self._snapshot_url = f"http://{host}:8080/?action=snapshot"
         self._attr_name = f"Creality {coordinator.data.get('model', 'Printer') if coordinator.data else 'Printer'} Camera"
-        self._attr_unique_id = f"{coordinator.config['host']}_camera"
-        model = coordinator.data.get('model', 'Printer') if coordinator.data else 'Printer'
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.config['host'])},
-            "name": f"Creality {model}",
-            "manufacturer": "Creality",
-            "model": model,
-            "sw_version": self._parse_firmware_version(),
-            "suggested_area": "Workshop",
-            "configuration_url": f"http://{coordinator.config['host']}:80"
-        }
+        self._attr_unique_id = f"{host}_camera"
+        self._update_flags()
+        self._init_device_info(host)
 
-    @property
-    def name(self):
-        """Return the name of the camera."""
-        return self._attr_name
+    async def async_added_to_hass(self):
+        """Refresh cached state when the coordinator reports new data."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_add_listener(self._handle_coordinator_update))
 
-    @property
-    def unique_id(self):
-        """Return a unique identifier for this camera."""
-        return self._attr_unique_id
+    @callback
+    def _handle_coordinator_update(self):
+        """Cache everything the camera reports from the latest coordinator data."""
+        self._update_flags()
+        self._recompute_device_info()
+        self.async_write_ha_state()
 
-    @property
-    def device_info(self):
-        """Return information about the device this camera is part of."""
-        return self._attr_device_info
+    def _update_flags(self):
+        """Cache the video flags and model name from the latest coordinator data."""
+        data = self.coordinator.data or EMPTY_DATA
+        self._video_enabled = data.get("video") == 1
+        self._is_recording = data.get("videoElapse") == 1
+        self._camera_model = f"{data.get('model') or 'Printer'} Camera"
 
     @property
     def available(self):
         """Return True if the camera is available."""
-        # Check if WebSocket is healthy
-        ws_healthy = True
-        if hasattr(self.coordinator, 'ws_client') and self.coordinator.ws_client:
-            ws_healthy = self.coordinator.ws_client.is_healthy()
-            
-        return (self.coordinator.data and 
-                self.coordinator.data.get("video", 0) == 1 and
-                self.coordinator.last_update_success and
-                ws_healthy)
+        return self._video_enabled and self.coordinator.healthy
 
     async def async_camera_image(self, width=None, height=None):
         """Return bytes of camera image."""
-        if not self.coordinator.data or self.coordinator.data.get("video", 0) != 1:
+        if not self._video_enabled:
             _LOGGER.debug("Camera not available - video disabled or no data")
             return None
-            
+
+        if self._frame is not None and time.monotonic() - self._frame_time < CAMERA_FRAME_TTL:
+            return self._frame
+
+        # Concurrent viewers wait for one fetch instead of each opening the stream
+        async with self._fetch_lock:
+            if self._frame is not None and time.monotonic() - self._frame_time < CAMERA_FRAME_TTL:
+                return self._frame
+            frame = await self._fetch_image()
+            if frame is not None:
+                self._frame = frame
+                self._frame_time = time.monotonic()
+            return frame
+
+    async def async_will_remove_from_hass(self):
+        """Close the background stream reader."""
+        await super().async_will_remove_from_hass()
+        if self._reader_task:
+            self._reader_task.cancel()
+            self._reader_task = None
+
+    async def _fetch_image(self):
+        """Fetch one JPEG frame from the printer."""
+        # mjpg-streamer can hand out a single encoded frame directly
+        if self._snapshot_supported is not False:
+            jpeg_data = await self._fetch_snapshot()
+            if jpeg_data is not None:
+                return jpeg_data
+        return await self._latest_stream_frame()
+
+    async def _latest_stream_frame(self):
+        """Return the newest frame from the background stream reader, starting it if needed."""
+        self._last_request = time.monotonic()
+        if self._reader_task is None or self._reader_task.done():
+            self._latest_frame = None
+            self._latest_frame_event.clear()
+            self._reader_task = self.hass.async_create_background_task(
+                self._stream_reader(), f"{self._attr_unique_id} MJPEG reader"
+            )
+
+        if self._latest_frame is None:
+            try:
+                await asyncio.wait_for(self._latest_frame_event.wait(), CAMERA_FIRST_FRAME_TIMEOUT)
+            except asyncio.TimeoutError:
+                _LOGGER.warning("Timeout reading camera stream data")
+                return None
+        return self._latest_frame
+
+    async def _stream_reader(self):
+        """Keep the MJPEG stream open and hold on to its most recent frame."""
+        _LOGGER.debug("Opening camera stream: %s", self._stream_url)
         try:
-            import aiohttp
-            # Use the known working camera URL
-            camera_url = f"http://{self.coordinator.config['host']}:8080/?action=stream"
-            _LOGGER.debug(f"Attempting to fetch camera image from: {camera_url}")
-            
-            # Headers that might be needed for MJPEG streams
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Linux; Home Assistant)',
-                'Accept': 'image/jpeg, image/png, image/*',
-                'Connection': 'keep-alive',
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(camera_url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as response:
-                    _LOGGER.debug(f"Camera response status: {response.status}")
-                    _LOGGER.debug(f"Camera response content-type: {response.headers.get('content-type', 'unknown')}")
-                    if response.status == 200:
-                        # For MJPEG streams, we need to extract a single JPEG frame
-                        try:
-                            async with asyncio.timeout(15):
-                                # Read the stream data in chunks until we have enough
-                                stream_data = b""
-                                async for chunk in response.content.iter_chunked(8192):
-                                    stream_data += chunk
-                                    # Try to extract JPEG frame after each chunk
-                                    jpeg_data = self._extract_jpeg_from_mjpeg(stream_data)
-                                    if jpeg_data:
-                                        _LOGGER.debug(f"Successfully extracted JPEG frame ({len(jpeg_data)} bytes)")
-                                        return jpeg_data
-                                    # Stop if we've read too much data (safety limit)
-                                    if len(stream_data) > 1024*1024:  # 1MB limit
-                                        _LOGGER.warning("Stream data too large, stopping")
-                                        break
-                                
-                                _LOGGER.warning("Could not extract JPEG frame from MJPEG stream")
-                                return None
-                        except asyncio.TimeoutError:
-                            _LOGGER.warning("Timeout reading camera stream data")
-                            return None
-                    else:
-                        _LOGGER.warning(f"Camera URL {camera_url} returned status {response.status}")
-                        return None
-            
+            async with self._session.get(self._stream_url, headers=CAMERA_HEADERS, timeout=CAMERA_STREAM_TIMEOUT) as response:
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Camera response status: %s, content-type: %s", response.status, response.headers.get('content-type', 'unknown'))
+                if response.status != 200:
+                    _LOGGER.warning("Camera URL %s returned status %s", self._stream_url, response.status)
+                    return
+
+                delimiter = _mjpeg_delimiter(response.headers.get('content-type', ''))
+                # Bytes read past the end of the current part
+                buffer = bytearray()
+                # Skip any preamble up to the first part
+                await _read_until(response.content, buffer, delimiter)
+
+                # Close rather than throttle once nobody is watching: frames left
+                # in a throttled socket would be stale by the time a viewer returns
+                while time.monotonic() - self._last_request < CAMERA_STREAM_IDLE:
+                    jpeg_data = await self._read_mjpeg_frame(response.content, buffer, delimiter)
+                    if not jpeg_data.startswith(b'\xff\xd8'):
+                        _LOGGER.warning("Extracted frame does not start with JPEG marker")
+                        continue
+                    self._latest_frame = jpeg_data
+                    self._latest_frame_event.set()
+                _LOGGER.debug("No camera viewers for %ss, closing stream", CAMERA_STREAM_IDLE)
+        except (ValueError, asyncio.IncompleteReadError) as e:
+            _LOGGER.warning("Could not extract JPEG frame from MJPEG stream: %s", e)
         except aiohttp.ClientError as e:
-            _LOGGER.error(f"Camera connection error: {e}")
-            return None
+            _LOGGER.error("Camera connection error: %s", e)
         except asyncio.TimeoutError:
             _LOGGER.error("Camera request timeout")
-            return None
         except Exception as e:
-            _LOGGER.error(f"Failed to get camera image: {e}")
+            _LOGGER.error("Failed to read camera stream: %s", e)
+        finally:
+            # Never serve frames from a stream that is gone; wake anyone waiting for a first one
+            self._latest_frame = None
+            self._latest_frame_event.set()
+
+    async def _fetch_snapshot(self):
+        """Return a JPEG from the snapshot action, or None to fall back to the stream."""
+        try:
+            async with self._session.get(self._snapshot_url, headers=CAMERA_HEADERS, timeout=CAMERA_SNAPSHOT_TIMEOUT) as response:
+                content_type = response.headers.get('content-type', '')
+                if response.status == 200 and content_type.startswith('image/jpeg'):
+                    self._snapshot_supported = True
+                    return await response.read()
+                _LOGGER.debug("Snapshot endpoint returned status %s (%s), using stream", response.status, content_type)
+        except aiohttp.ClientError as e:
+            _LOGGER.debug("Snapshot request failed: %s", e)
             return None
+        except asyncio.TimeoutError:
+            # A printer without the snapshot action may never answer it; don't
+            # make every image request wait out the timeout before the stream
+            _LOGGER.debug("Snapshot request timed out, using stream")
+
+        # Only give up on snapshots if they never worked for this printer
+        if self._snapshot_supported is None:
+            self._snapshot_supported = False
+        return None
+
+    async def _read_mjpeg_frame(self, content, buffer, delimiter):
+        """Read the next JPEG part from an MJPEG response body.
+
+        Expects the stream to be positioned after a delimiter or after the
+        previous part's body; either way the next header block ends at the
+        first blank line. buffer holds bytes already read from content.
+        """
+        headers = await _read_until(content, buffer, MJPEG_HEADER_END)
+
+        match = MJPEG_CONTENT_LENGTH_RE.search(headers)
+        if match is not None:
+            jpeg_length = int(match.group(1))
+            if jpeg_length > MJPEG_MAX_BUFFER:
+                raise ValueError(f"frame of {jpeg_length} bytes exceeds the size limit")
+            # Leave the trailing delimiter for the next header read so the
+            # frame is returned without waiting for the next part
+            if len(buffer) < jpeg_length:
+                buffer += await content.readexactly(jpeg_length - len(buffer))
+            jpeg_data = bytes(buffer[:jpeg_length])
+            del buffer[:jpeg_length]
+            return jpeg_data
+
+        # No length given: the part runs until the next delimiter
+        part = await _read_until(content, buffer, b'\r\n' + delimiter)
+        return part[:-len(delimiter) - 2]
 
     @property
     def is_recording(self):
         """Return true if the device is recording."""
-        return self.coordinator.data.get("videoElapse", 0) == 1 if self.coordinator.data else False
-
-    @property
-    def brand(self):
-        """Return the camera brand."""
-        return "Creality"
+        return self._is_recording
 
     @property
     def model(self):
         """Return the camera model."""
-        return f"{self.coordinator.data.get('model', 'Printer')} Camera" if self.coordinator.data else "Printer Camera"
-
-    def _parse_firmware_version(self):
-        """Parse firmware version from modelVersion data."""
-        if not self.coordinator.data:
-            return "Unknown"
-            
-        raw_version = self.coordinator.data.get("modelVersion", "")
-        if not raw_version:
-            return "Unknown"
-        
-        # Parse the version string: "printer hw ver:;printer sw ver:;DWIN hw ver:CR4CU220812S11;DWIN sw ver:1.3.3.46;"
-        try:
-            # Split by semicolon and find the DWIN software version
-            parts = raw_version.split(';')
-            for part in parts:
-                if 'DWIN sw ver:' in part:
-                    version = part.replace('DWIN sw ver:', '').strip()
-                    if version:
-                        return version
-            
-            # If no DWIN version found, try to find any version
-            for part in parts:
-                if 'sw ver:' in part and part.replace('sw ver:', '').strip():
-                    version = part.replace('sw ver:', '').strip()
-                    if version:
-                        return version
-                        
-        except Exception:
-            pass
-        
-        # Fallback to raw version if parsing fails
-        return raw_version
-
-    def _extract_jpeg_from_mjpeg(self, stream_data):
-        """Extract a single JPEG frame from MJPEG stream data."""
-        try:
-            # MJPEG format: --boundary\r\nContent-Type: image/jpeg\r\nContent-Length: XXXX\r\n\r\n[JPEG_DATA]
-            boundary_marker = b'--boundarydonotcross'
-            content_length = b'Content-Length: '
-            
-            # Find the boundary marker
-            boundary_pos = stream_data.find(boundary_marker)
-            if boundary_pos == -1:
-                _LOGGER.warning("No boundary marker found in stream")
-                return None
-            
-            # Find Content-Length header
-            length_start = stream_data.find(content_length, boundary_pos)
-            if length_start == -1:
-                _LOGGER.warning("No Content-Length header found")
-                return None
-            
-            # Extract the content length
-            length_end = stream_data.find(b'\r\n', length_start)
-            if length_end == -1:
-                _LOGGER.warning("Malformed Content-Length header")
-                return None
-            
-            try:
-                length_str = stream_data[length_start + len(content_length):length_end]
-                jpeg_length = int(length_str)
-                _LOGGER.debug(f"JPEG content length: {jpeg_length} bytes")
-            except ValueError:
-                _LOGGER.warning(f"Could not parse content length: {length_str}")
-                return None
-            
-            # Find the start of JPEG data (after \r\n\r\n)
-            jpeg_start_marker = b'\r\n\r\n'
-            jpeg_start_pos = stream_data.find(jpeg_start_marker, boundary_pos)
-            if jpeg_start_pos == -1:
-                _LOGGER.warning("Could not find JPEG data start marker")
-                return None
-            
-            jpeg_data_start = jpeg_start_pos + len(jpeg_start_marker)
-            jpeg_data_end = jpeg_data_start + jpeg_length
-            
-            # Check if we have enough data
-            if jpeg_data_end > len(stream_data):
-                _LOGGER.warning(f"Not enough data: have {len(stream_data)}, need {jpeg_data_end}")
-                return None
-            
-            # Extract the JPEG frame
-            jpeg_frame = stream_data[jpeg_data_start:jpeg_data_end]
-            
-            # Verify it's a valid JPEG by checking the start marker
-            if jpeg_frame.startswith(b'\xff\xd8'):
-                _LOGGER.debug(f"Extracted JPEG frame: {len(jpeg_frame)} bytes")
-                return jpeg_frame
-            else:
-                _LOGGER.warning("Extracted frame does not start with JPEG marker")
-                return None
-                
-        except Exception as e:
-            _LOGGER.error(f"Error extracting JPEG from MJPEG stream: {e}")
-            return None
+        return self._camera_model
+
+
+def _mjpeg_delimiter(content_type):
+    """Return the part delimiter declared in a multipart Content-Type header."""
+    match = MJPEG_BOUNDARY_RE.search(content_type)
+    if match is None:
+        return MJPEG_BOUNDARY
+    boundary = match.group(1).strip().encode()
+    # Some servers already include the leading dashes in the parameter
+    return boundary if boundary.startswith(b'--') else b'--' + boundary
+
+
+async def _read_until(content, buffer, marker):
+    """Return the stream bytes up to and including marker.
 
+    StreamReader.readuntil gives up once the match is further away than its
+    128 KiB high-water mark, which a single frame easily exceeds, so scan in
+    our own buffer instead. Anything read past the marker stays in buffer.
+    """
+    start = 0
+    while True:
+        index = buffer.find(marker, start)
+        if index != -1:
+            end = index + len(marker)
+            data = bytes(buffer[:end])
+            del buffer[:end]
+            return data
+        if len(buffer) > MJPEG_MAX_BUFFER:
+            raise ValueError("no part boundary found within the size limit")
+        # The marker may straddle the next chunk
+        start = max(0, len(buffer) - len(marker) + 1)
+        chunk = await content.readany()
+        if not chunk:
+            raise asyncio.IncompleteReadError(bytes(buffer), None)
+        buffer += chunk
@@ -1 +1,4 @@
 DOMAIN = "creality_control"
+
+# Model name used when neither the printer nor its port identifies one
+DEFAULT_MODEL = "Creality Printer"
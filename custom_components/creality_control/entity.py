@@ -0,0 +1,99 @@
+"""Shared entity helpers for Creality Control."""
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from .const import DEFAULT_MODEL, DOMAIN
+from .util import EMPTY_DATA, parse_firmware_version
+
+# Coordinator keys that feed device info
+DEVICE_INFO_KEYS = frozenset(("model", "printerModel", "modelVersion"))
+
+
+class CrealityDeviceInfoMixin:
+    """Builds and caches the printer device info for an entity.
+
+    Entities call _init_device_info from __init__ and _recompute_device_info
+    whenever the coordinator has new data; the dict is only rebuilt when the
+    model or firmware fields change.
+    """
+
+    def _init_device_info(self, host):
+        """Precompute the host-derived fields and build the initial device info."""
+        self._identifiers = {(DOMAIN, host)}
+        self._configuration_url = f"http://{host}:80"
+        self._device_info_key = None
+        self._recompute_device_info()
+
+    @callback
+    def _recompute_device_info(self):
+        """Rebuild the cached device info if the model or firmware changed."""
+        data = self.coordinator.data or EMPTY_DATA
+        key = (data.get("detected_model"), data.get("modelVersion"))
+        if key == self._device_info_key:
+            return
+        self._device_info_key = key
+        self._attr_device_info = self._build_device_info()
+
+    @property
+    def device_info(self):
+        """Return information about the device this entity is part of."""
+        return self._attr_device_info
+
+    def _build_device_info(self):
+        """Build the device info dict from the current coordinator data."""
+        # The coordinator publishes the normalized model as detected_model
+        data = self.coordinator.data or EMPTY_DATA
+        model = data.get("detected_model") or DEFAULT_MODEL
+
+        return {
+            "identifiers": self._identifiers,
+            "name": f"Creality {model}",
+            "manufacturer": "Creality",
+            "model": model,
+            "sw_version": self._parse_firmware_version(),
+            "suggested_area": "Workshop",
+            "configuration_url": self._configuration_url
+        }
+
+    def _parse_firmware_version(self):
+        """Parse firmware version from modelVersion data."""
+        data = self.coordinator.data or EMPTY_DATA
+        return parse_firmware_version(data.get("modelVersion"))
+
+
+class CrealityEntity(CrealityDeviceInfoMixin, CoordinatorEntity):
+    """Base class for coordinator-backed Creality entities."""
+
+    # Updates are pushed by the coordinator
+    _attr_should_poll = False
+    # State and availability from the last coordinator-driven write
+    _last_written = None
+    # Coordinator keys this entity depends on; None refreshes on every update
+    _watched_keys = None
+
+    def __init__(self, coordinator):
+        super().__init__(coordinator)
+        self._init_device_info(coordinator.config['host'])
+
+    @property
+    def available(self):
+        """Return True if the entity is available."""
+        # Data is pushed over the WebSocket, so its health is the whole story
+        return self.coordinator.healthy
+
+    def _watch_keys(self, *keys):
+        """Only refresh on WebSocket updates that touch keys or device info."""
+        self._watched_keys = DEVICE_INFO_KEYS.union(keys)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached device info and write state only if it changed."""
+        changed = self.coordinator.changed_keys
+        if changed is not None and self._watched_keys is not None and self._watched_keys.isdisjoint(changed):
+            return
+        self._recompute_device_info()
+        # Most fields change rarely, so most updates would be no-op writes
+        written = (self.state, self.available)
+        if written == self._last_written:
+            return
+        self._last_written = written
+        super()._handle_coordinator_update()
@@ -1,302 +1,247 @@
 import logging
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from datetime import timedelta
+from functools import cached_property
+from itertools import chain
+from homeassistant.core import callback
 from .const import DOMAIN
+from .entity import CrealityEntity
+from .util import parse_firmware_version
 
 _LOGGER = logging.getLogger(__name__)
 
-async def async_setup_entry(hass, entry, async_add_entities):
-    """Set up Creality Control sensors from a config entry."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
-    sensors = [
+# (data key, entity name, unit of measurement) for the plain sensors; names are
+# formatted once here rather than in every CrealitySensor.__init__
+_SENSOR_SPECS = tuple(
+    (key, f"Creality {name_suffix}", unit)
+    for key, name_suffix, unit in (
         # Print Status and Progress
-        CrealitySensor(coordinator, "state", "Print State"),
-        CrealitySensor(coordinator, "deviceState", "Device State"),
-        CrealitySensor(coordinator, "printProgress", "Print Progress", unit_of_measurement="%"),
-        CrealitySensor(coordinator, "layer", "Current Layer"),
-        CrealitySensor(coordinator, "TotalLayer", "Total Layers"),
-        CrealityTimeLeftSensor(coordinator, "printLeftTime", "Time Left"),
-        CrealitySensor(coordinator, "printJobTime", "Print Job Time", unit_of_measurement="s"),
-        CrealitySensor(coordinator, "printFileName", "Print Filename"),
-        CrealitySensor(coordinator, "printId", "Print ID"),
-        
+        ("state", "Print State", None),
+        ("deviceState", "Device State", None),
+        ("printProgress", "Print Progress", "%"),
+        ("layer", "Current Layer", None),
+        ("TotalLayer", "Total Layers", None),
+        ("printJobTime", "Print Job Time", "s"),
+        ("printFileName", "Print Filename", None),
+        ("printId", "Print ID", None),
+    
         # Temperature Sensors
-        CrealitySensor(coordinator, "nozzleTemp", "Nozzle Temperature", unit_of_measurement="°C"),
-        CrealitySensor(coordinator, "targetNozzleTemp", "Target Nozzle Temperature", unit_of_measurement="°C"),
-        CrealitySensor(coordinator, "bedTemp0", "Bed Temperature", unit_of_measurement="°C"),
-        CrealitySensor(coordinator, "targetBedTemp0", "Target Bed Temperature", unit_of_measurement="°C"),
-        CrealitySensor(coordinator, "boxTemp", "Box Temperature", unit_of_measurement="°C"),
-        
+        ("nozzleTemp", "Nozzle Temperature", "°C"),
+        ("targetNozzleTemp", "Target Nozzle Temperature", "°C"),
+        ("bedTemp0", "Bed Temperature", "°C"),
+        ("targetBedTemp0", "Target Bed Temperature", "°C"),
+        ("boxTemp", "Box Temperature", "°C"),
+    
         # Position and Movement
-        CrealitySensor(coordinator, "curPosition", "Current Position"),
-        CrealitySensor(coordinator, "realTimeSpeed", "Real Time Speed", unit_of_measurement="mm/s"),
-        CrealitySensor(coordinator, "realTimeFlow", "Real Time Flow", unit_of_measurement="mm³/s"),
-        CrealitySensor(coordinator, "curFeedratePct", "Feedrate", unit_of_measurement="%"),
-        CrealitySensor(coordinator, "curFlowratePct", "Flowrate", unit_of_measurement="%"),
-        
+        ("curPosition", "Current Position", None),
+        ("realTimeSpeed", "Real Time Speed", "mm/s"),
+        ("realTimeFlow", "Real Time Flow", "mm³/s"),
+        ("curFeedratePct", "Feedrate", "%"),
+        ("curFlowratePct", "Flowrate", "%"),
+    
         # Fan Controls
-        CrealitySensor(coordinator, "fan", "Fan Status"),
-        CrealitySensor(coordinator, "fanAuxiliary", "Auxiliary Fan"),
-        CrealitySensor(coordinator, "fanCase", "Case Fan"),
-        CrealitySensor(coordinator, "auxiliaryFanPct", "Auxiliary Fan Speed", unit_of_measurement="%"),
-        CrealitySensor(coordinator, "caseFanPct", "Case Fan Speed", unit_of_measurement="%"),
-        CrealitySensor(coordinator, "modelFanPct", "Model Fan Speed", unit_of_measurement="%"),
-        
+        ("fan", "Fan Status", None),
+        ("fanAuxiliary", "Auxiliary Fan", None),
+        ("fanCase", "Case Fan", None),
+        ("auxiliaryFanPct", "Auxiliary Fan Speed", "%"),
+        ("caseFanPct", "Case Fan Speed", "%"),
+        ("modelFanPct", "Model Fan Speed", "%"),
+    
         # Material and Usage
-        CrealitySensor(coordinator, "usedMaterialLength", "Used Material Length", unit_of_measurement="mm"),
-        CrealitySensor(coordinator, "materialDetect", "Material Detection"),
-        CrealitySensor(coordinator, "materialStatus", "Material Status"),
-        
+        ("usedMaterialLength", "Used Material Length", "mm"),
+        ("materialDetect", "Material Detection", None),
+        ("materialStatus", "Material Status", None),
+    
         # System Information
-        CrealitySensor(coordinator, "model", "Printer Model"),
-        CrealitySensor(coordinator, "hostname", "Hostname"),
-        CrealityFirmwareSensor(coordinator, "modelVersion", "Firmware Version"),
-        CrealitySensor(coordinator, "connect", "Connection Status"),
-        CrealitySensor(coordinator, "tfCard", "TF Card Status"),
-        CrealitySensor(coordinator, "video", "Camera Status"),
-        
+        ("model", "Printer Model", None),
+        ("hostname", "Hostname", None),
+        ("connect", "Connection Status", None),
+        ("tfCard", "TF Card Status", None),
+        ("video", "Camera Status", None),
+    
         # AI Features (K1SE/K1C)
-        CrealitySensor(coordinator, "aiDetection", "AI Detection"),
-        CrealitySensor(coordinator, "aiFirstFloor", "AI First Floor"),
-        CrealitySensor(coordinator, "aiPausePrint", "AI Pause Print"),
-        CrealitySensor(coordinator, "aiSw", "AI Switch"),
-        
+        ("aiDetection", "AI Detection", None),
+        ("aiFirstFloor", "AI First Floor", None),
+        ("aiPausePrint", "AI Pause Print", None),
+        ("aiSw", "AI Switch", None),
+    
         # Light Control
-        CrealitySensor(coordinator, "lightSw", "Light Switch"),
-        
+        ("lightSw", "Light Switch", None),
+    
         # Auto Home Status
-        CrealitySensor(coordinator, "autohome", "Auto Home Status"),
-        CrealitySensor(coordinator, "enableSelfTest", "Self Test Enabled"),
-        CrealitySensor(coordinator, "withSelfTest", "Self Test Status"),
-        
+        ("autohome", "Auto Home Status", None),
+        ("enableSelfTest", "Self Test Enabled", None),
+        ("withSelfTest", "Self Test Status", None),
+    
         # Error and Status
-        CrealityErrorSensor(coordinator, "err", "Error Status"),
-        CrealitySensor(coordinator, "powerLoss", "Power Loss Detection"),
-        CrealitySensor(coordinator, "upgradeStatus", "Upgrade Status"),
-        CrealitySensor(coordinator, "repoPlrStatus", "Repository Status"),
-        
+        ("powerLoss", "Power Loss Detection", None),
+        ("upgradeStatus", "Upgrade Status", None),
+        ("repoPlrStatus", "Repository Status", None),
+    
         # Temperature Limits
-        CrealitySensor(coordinator, "maxBedTemp", "Max Bed Temperature", unit_of_measurement="°C"),
-        CrealitySensor(coordinator, "maxNozzleTemp", "Max Nozzle Temperature", unit_of_measurement="°C"),
-        
+        ("maxBedTemp", "Max Bed Temperature", "°C"),
+        ("maxNozzleTemp", "Max Nozzle Temperature", "°C"),
+    
         # Additional Bed Temperatures
-        CrealitySensor(coordinator, "bedTemp1", "Bed Temperature 1", unit_of_measurement="°C"),
-        CrealitySensor(coordinator, "bedTemp2", "Bed Temperature 2", unit_of_measurement="°C"),
-        CrealitySensor(coordinator, "targetBedTemp1", "Target Bed Temperature 1", unit_of_measurement="°C"),
-        CrealitySensor(coordinator, "targetBedTemp2", "Target Bed Temperature 2", unit_of_measurement="°C"),
-        
+        ("bedTemp1", "Bed Temperature 1", "°C"),
+        ("bedTemp2", "Bed Temperature 2", "°C"),
+        ("targetBedTemp1", "Target Bed Temperature 1", "°C"),
+        ("targetBedTemp2", "Target Bed Temperature 2", "°C"),
+    
         # PID Control
-        CrealitySensor(coordinator, "bedTempAutoPid", "Bed PID Control"),
-        CrealitySensor(coordinator, "nozzleTempAutoPid", "Nozzle PID Control"),
-        
+        ("bedTempAutoPid", "Bed PID Control", None),
+        ("nozzleTempAutoPid", "Nozzle PID Control", None),
+    
         # Video Features
-        CrealitySensor(coordinator, "video1", "Video Stream 1"),
-        CrealitySensor(coordinator, "videoElapse", "Video Elapse"),
-        CrealitySensor(coordinator, "videoElapseFrame", "Video Elapse Frame"),
-        CrealitySensor(coordinator, "videoElapseInterval", "Video Elapse Interval"),
-        
+        ("video1", "Video Stream 1", None),
+        ("videoElapse", "Video Elapse", None),
+        ("videoElapseFrame", "Video Elapse Frame", None),
+        ("videoElapseInterval", "Video Elapse Interval", None),
+    
         # Advanced Settings
-        CrealitySensor(coordinator, "pressureAdvance", "Pressure Advance"),
-        CrealitySensor(coordinator, "smoothTime", "Smooth Time", unit_of_measurement="s"),
-        CrealitySensor(coordinator, "velocityLimits", "Velocity Limits", unit_of_measurement="mm/s"),
-        CrealitySensor(coordinator, "accelerationLimits", "Acceleration Limits", unit_of_measurement="mm/s²"),
-        CrealitySensor(coordinator, "cornerVelocityLimits", "Corner Velocity Limits", unit_of_measurement="mm/s"),
-        
+        ("pressureAdvance", "Pressure Advance", None),
+        ("smoothTime", "Smooth Time", "s"),
+        ("velocityLimits", "Velocity Limits", "mm/s"),
+        ("accelerationLimits", "Acceleration Limits", "mm/s²"),
+        ("cornerVelocityLimits", "Corner Velocity Limits", "mm/s"),
+    
         # Legacy Halot sensors (for backward compatibility)
-        CrealitySensor(coordinator, "printStatus", "Legacy Status"),
-        CrealitySensor(coordinator, "filename", "Legacy Filename"),
-        CrealityTimeLeftSensor(coordinator, "printRemainTime", "Legacy Time Left"),
-        CrealitySensor(coordinator, "progress", "Legacy Progress", unit_of_measurement="%"),
-        CrealitySensor(coordinator, "curSliceLayer", "Legacy Current Layer"),
-        CrealitySensor(coordinator, "sliceLayerCount", "Legacy Total Layers"),
-    ]
-    async_add_entities(sensors)
+        ("printStatus", "Legacy Status", None),
+        ("filename", "Legacy Filename", None),
+        ("progress", "Legacy Progress", "%"),
+        ("curSliceLayer", "Legacy Current Layer", None),
+        ("sliceLayerCount", "Legacy Total Layers", None),
+    )
+)
+
+async def async_setup_entry(hass, entry, async_add_entities):
+    """Set up Creality Control sensors from a config entry."""
+    # Platforms are set up concurrently; keep this free of awaits so one
+    # platform never holds up the others during startup.
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(chain(
+        (
+            CrealitySensor(coordinator, key, name, unit_of_measurement=unit)
+            for key, name, unit in _SENSOR_SPECS
+        ),
+        (
+            sensor_cls(coordinator, key, name)
+            for sensor_cls, key, name in _FORMATTED_SENSOR_SPECS
+        ),
+    ))
+
+def _state_legacy_progress(data, key):
+    """Calculate progress from the current and total slice layers."""
+    try:
+        total_layers = float(data.get("sliceLayerCount", 0))
+        if not total_layers:
+            return 0
+        # Percentage rounded half-up to two decimals
+        return int(float(data.get("curSliceLayer", 0)) / total_layers * 10000 + 0.5) / 100
+    except (ValueError, TypeError):
+        return 0
+
+def _state_progress(data, key):
+    """Return the K1C progress value, falling back to the legacy calculation."""
+    if "printProgress" in data:
+        return data["printProgress"]
+    return _state_legacy_progress(data, key)
+
+def _state_direct(data, key):
+    """Return the raw K1C progress value."""
+    return data.get(key, 0)
+
+def _state_default(data, key):
+    """Return the raw value reported for the sensor key."""
+    value = data.get(key, "Unknown")
+    if value == "Unknown" and _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Sensor %s: Key not found in data. Available keys: %s", key, list(data.keys()))
+    return value
 
-class CrealitySensor(CoordinatorEntity):
+# State handlers for keys that need more than a plain lookup, chosen once per sensor
+_STATE_DISPATCH = {
+    "progress": _state_progress,
+    "printProgress": _state_direct,
+    "legacy_progress": _state_legacy_progress,
+}
+
+# Extra data keys read by the handlers above
+_STATE_KEYS = {
+    "progress": ("printProgress", "curSliceLayer", "sliceLayerCount"),
+    "legacy_progress": ("curSliceLayer", "sliceLayerCount"),
+}
+
+class CrealitySensor(CrealityEntity):
     """Defines a single Creality sensor."""
 
-    def __init__(self, coordinator, data_key, name_suffix, unit_of_measurement=None):
+    def __init__(self, coordinator, data_key, name, unit_of_measurement=None):
         super().__init__(coordinator)
         self.data_key = data_key
-        self._attr_name = f"Creality {name_suffix}"
-        self._attr_unique_id = f"{coordinator.config['host']}_{data_key}"
-        self._unit_of_measurement = unit_of_measurement
-
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return self._attr_name
-
-    @property
-    def unique_id(self):
-        """Return a unique identifier for this sensor."""
-        return self._attr_unique_id
+        self._attr_name = name
+        host = coordinator.config['host']
+        self._attr_unique_id = f"{host}_{data_key}"
+        self._attr_unit_of_measurement = unit_of_measurement
+        self._state_fn = _STATE_DISPATCH.get(data_key, _state_default)
+        self._watch_keys(data_key, *_STATE_KEYS.get(data_key, ()))
 
-    @property
+    @cached_property
     def state(self):
         """Return the state of the sensor."""
-        if not self.coordinator.data:
-            _LOGGER.debug(f"Sensor {self.data_key}: No coordinator data")
+        data = self.coordinator.data
+        if not data:
+            _LOGGER.debug("Sensor %s: No coordinator data", self.data_key)
             return "Unknown"
-            
-        # Special handling for progress calculations
-        if self.data_key == "progress":
-            # Try K1C format first
-            if "printProgress" in self.coordinator.data:
-                return self.coordinator.data["printProgress"]
-            # Fallback to legacy calculation
-            cur_layer = self.coordinator.data.get("curSliceLayer", 0)
-            total_layers = self.coordinator.data.get("sliceLayerCount", 0)
-            try:
-                progress = (float(cur_layer) / float(total_layers)) * 100 if total_layers else 0
-                return round(progress, 2)
-            except ValueError:
-                return 0
-        elif self.data_key == "printProgress":
-            # Direct K1C progress value
-            return self.coordinator.data.get("printProgress", 0)
-        elif self.data_key == "legacy_progress":
-            # Legacy progress calculation
-            cur_layer = self.coordinator.data.get("curSliceLayer", 0)
-            total_layers = self.coordinator.data.get("sliceLayerCount", 0)
-            try:
-                progress = (float(cur_layer) / float(total_layers)) * 100 if total_layers else 0
-                return round(progress, 2)
-            except ValueError:
-                return 0
-        
-        value = self.coordinator.data.get(self.data_key, "Unknown")
-        if value == "Unknown":
-            _LOGGER.debug(f"Sensor {self.data_key}: Key not found in data. Available keys: {list(self.coordinator.data.keys())}")
-        return value
-
-    @property
-    def unit_of_measurement(self):
-        """Return the unit of measurement if defined."""
-        return self._unit_of_measurement
-
-    def _parse_firmware_version(self):
-        """Parse firmware version from modelVersion data."""
-        if not self.coordinator.data:
-            return "Unknown"
-            
-        raw_version = self.coordinator.data.get("modelVersion", "")
-        if not raw_version:
-            return "Unknown"
-        
-        # Parse the version string: "printer hw ver:;printer sw ver:;DWIN hw ver:CR4CU220812S11;DWIN sw ver:1.3.3.46;"
-        try:
-            # Split by semicolon and find the DWIN software version
-            parts = raw_version.split(';')
-            for part in parts:
-                if 'DWIN sw ver:' in part:
-                    version = part.replace('DWIN sw ver:', '').strip()
-                    if version:
-                        return version
-            
-            # If no DWIN version found, try to find any version
-            for part in parts:
-                if 'sw ver:' in part and part.replace('sw ver:', '').strip():
-                    version = part.replace('sw ver:', '').strip()
-                    if version:
-                        return version
-                        
-        except Exception:
-            pass
-        
-        # Fallback to raw version if parsing fails
-        return raw_version
+        return self._state_fn(data, self.data_key)
 
-    @property
-    def available(self):
-        """Return True if the sensor is available."""
-        # Check if WebSocket is healthy
-        if hasattr(self.coordinator, 'ws_client') and self.coordinator.ws_client:
-            return self.coordinator.ws_client.is_healthy() and self.coordinator.last_update_success
-        return self.coordinator.last_update_success
-
-    @property
-    def device_info(self):
-        """Return information about the device this sensor is part of."""
-        # Try to detect printer model from data if available
-        model = "Creality Printer"
-        if self.coordinator.data:
-            if "model" in self.coordinator.data:
-                model = self.coordinator.data["model"]
-            elif "printerModel" in self.coordinator.data:
-                model = self.coordinator.data["printerModel"]
-            elif "detected_model" in self.coordinator.data:
-                model = self.coordinator.data["detected_model"]
-        
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.config['host'])},
-            "name": f"Creality {model}",
-            "manufacturer": "Creality",
-            "model": model,
-            "sw_version": self._parse_firmware_version(),
-            "suggested_area": "Workshop",
-            "configuration_url": f"http://{self.coordinator.config['host']}:80"
-        }
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop the cached state so it is recomputed from the new data."""
+        self.__dict__.pop("state", None)
+        super()._handle_coordinator_update()
 
 class CrealityTimeLeftSensor(CrealitySensor):
     """Specialized sensor class for handling 'Time Left' data."""
 
-    @property
+    @cached_property
     def state(self):
-        """Return the state of the sensor, converting time to HH:MM:SS format."""
-        if not self.coordinator.data:
+        """Return the state of the sensor, formatted like str(timedelta)."""
+        data = self.coordinator.data
+        if not data:
             return "00:00:00"
-        time_left = int(self.coordinator.data.get(self.data_key, 0))
-        return str(timedelta(seconds=time_left))
+        try:
+            time_left = max(int(float(data.get(self.data_key) or 0)), 0)
+        except (TypeError, ValueError):
+            time_left = 0
+        # Keep the "[N day(s), ]H:MM:SS" text automations already parse
+        days, remainder = divmod(time_left, 86400)
+        hours, remainder = divmod(remainder, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        if days:
+            return f"{days} day{'s' if days != 1 else ''}, {hours}:{minutes:02d}:{seconds:02d}"
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
 
 
 class CrealityFirmwareSensor(CrealitySensor):
     """Specialized sensor class for handling firmware version data."""
 
-    @property
+    @cached_property
     def state(self):
         """Return a clean firmware version."""
-        if not self.coordinator.data:
-            return "Unknown"
-            
-        raw_version = self.coordinator.data.get(self.data_key, "")
-        if not raw_version:
+        data = self.coordinator.data
+        if not data:
             return "Unknown"
-        
-        # Parse the version string: "printer hw ver:;printer sw ver:;DWIN hw ver:CR4CU220812S11;DWIN sw ver:1.3.3.46;"
-        try:
-            # Split by semicolon and find the DWIN software version
-            parts = raw_version.split(';')
-            for part in parts:
-                if 'DWIN sw ver:' in part:
-                    version = part.replace('DWIN sw ver:', '').strip()
-                    if version:
-                        return version
-            
-            # If no DWIN version found, try to find any version
-            for part in parts:
-                if 'sw ver:' in part and part.replace('sw ver:', '').strip():
-                    version = part.replace('sw ver:', '').strip()
-                    if version:
-                        return version
-                        
-        except Exception:
-            pass
-        
-        # Fallback to raw version if parsing fails
-        return raw_version
+        return parse_firmware_version(data.get(self.data_key))
 
 
 class CrealityErrorSensor(CrealitySensor):
     """Specialized sensor class for handling error status data."""
 
-    @property
+    @cached_property
     def state(self):
         """Return error status information."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return "Unknown"
             
-        error_data = self.coordinator.data.get(self.data_key, {})
+        error_data = data.get(self.data_key, {})
         if not error_data or not isinstance(error_data, dict):
             return "No Errors"
         
@@ -308,3 +253,13 @@ class CrealityErrorSensor(CrealitySensor):
             return "No Errors"
         
         return f"Error {errcode} (Key: {key})"
+
+
+# (sensor class, data key, entity name) for sensors that format their raw value;
+# kept below the class definitions they reference
+_FORMATTED_SENSOR_SPECS = (
+    (CrealityTimeLeftSensor, "printLeftTime", "Creality Time Left"),
+    (CrealityFirmwareSensor, "modelVersion", "Creality Firmware Version"),
+    (CrealityErrorSensor, "err", "Creality Error Status"),
+    (CrealityTimeLeftSensor, "printRemainTime", "Creality Legacy Time Left"),
+)
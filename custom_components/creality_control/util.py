@@ -0,0 +1,44 @@
+"""Shared helpers for Creality Control entities."""
+from functools import lru_cache
+from types import MappingProxyType
+
+# "printer hw ver:;printer sw ver:;DWIN hw ver:CR4CU220812S11;DWIN sw ver:1.3.3.46;"
+# Version field markers, most preferred first
+_SW_VERSION_MARKERS = ("DWIN sw ver:", "sw ver:")
+
+# Read-only stand-in for coordinator data before the first update
+EMPTY_DATA = MappingProxyType({})
+
+
+@lru_cache(maxsize=8)
+def parse_firmware_version(raw_version):
+    """Return the software version from a modelVersion string.
+
+    Prefers the DWIN software version, then any other non-empty "sw ver"
+    field, and falls back to the raw string. Results are cached because
+    modelVersion rarely changes while device info is built often.
+    """
+    if not raw_version:
+        return "Unknown"
+    for marker in _SW_VERSION_MARKERS:
+        version = _field_version(raw_version, marker)
+        if version:
+            return version
+    return raw_version
+
+
+def _field_version(raw_version, marker):
+    """Return the first ";"-separated field holding marker, minus the marker.
+
+    Matches the original split-based parser, which stripped only the marker
+    and kept any other text in the field ("printer sw ver:1.2" gives
+    "printer 1.2"). Fields that end up empty are skipped.
+    """
+    head, sep, tail = raw_version.partition(marker)
+    while sep:
+        value, _, rest = tail.partition(";")
+        version = (head.rpartition(";")[2] + value).replace(marker, "").strip()
+        if version:
+            return version
+        head, sep, tail = rest.partition(marker)
+    return None
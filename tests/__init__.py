@@ -0,0 +1 @@
+"""Tests for the Creality Control integration."""
@@ -0,0 +1,25 @@
+"""Tests for the Creality Control sensors."""
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.creality_control.sensor import CrealityTimeLeftSensor
+
+
+def _time_left_state(value):
+    """Return the time-left sensor state for a raw printLeftTime value."""
+    coordinator = SimpleNamespace(data={"printLeftTime": value}, config={"host": "192.0.2.1"})
+    return CrealityTimeLeftSensor(coordinator, "printLeftTime", "Creality Time Left").state
+
+
+@pytest.mark.parametrize("seconds", [0, 59, 3723, 86399, 86400, 90061, 2 * 86400 + 5, 40 * 86400 + 3599])
+def test_time_left_matches_timedelta(seconds):
+    """The state keeps the text str(timedelta) produced, day prefix included."""
+    assert _time_left_state(seconds) == str(timedelta(seconds=seconds))
+
+
+@pytest.mark.parametrize(("value", "expected"), [(None, "0:00:00"), ("3723.9", "1:02:03"), ("n/a", "0:00:00"), (-5, "0:00:00")])
+def test_time_left_tolerates_bad_values(value, expected):
+    """Missing, fractional, non-numeric and negative values still give a valid state."""
+    assert _time_left_state(value) == expected
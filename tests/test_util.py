@@ -0,0 +1,23 @@
+"""Tests for the shared Creality Control helpers."""
+import pytest
+
+from custom_components.creality_control.util import parse_firmware_version
+
+
+@pytest.mark.parametrize(
+    ("raw_version", "expected"),
+    [
+        ("printer hw ver:;printer sw ver:;DWIN hw ver:CR4CU220812S11;DWIN sw ver:1.3.3.46;", "1.3.3.46"),
+        ("DWIN sw ver: 1.3.3.46 ;printer sw ver:2.0;", "1.3.3.46"),
+        # Only the marker is removed; the rest of the field is kept
+        ("printer hw ver:;printer sw ver:1.2;DWIN hw ver:;DWIN sw ver:;", "printer 1.2"),
+        ("printer sw ver:1.2", "printer 1.2"),
+        ("DWIN sw ver: ;printer sw ver:2.0;", "DWIN"),
+        ("K1C-1.0", "K1C-1.0"),
+        ("", "Unknown"),
+        (None, "Unknown"),
+    ],
+)
+def test_parse_firmware_version(raw_version, expected):
+    """The parsed version matches the original per-entity parser's output."""
+    assert parse_firmware_version(raw_version) == expected